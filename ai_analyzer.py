@@ -6,6 +6,7 @@ Uses LLM API to generate deep market insights, trend analysis, and recommendatio
 import json
 import os
 import ssl
+import threading
 import time
 import urllib.request
 import urllib.error
@@ -88,12 +89,32 @@ def _load_cache() -> dict:
     return {}
 
 
+def _write_json(path: str, data):
+    """Write JSON through a temp file and os.replace so readers never see a partial file."""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    with open(tmp_path, "w") as f:
+        json.dump(data, f, indent=2)
+    os.replace(tmp_path, path)
+
+
 def _save_cache(data: dict):
     """Save analysis results to cache."""
     data["timestamp"] = time.time()
-    os.makedirs(os.path.dirname(CACHE_FILE), exist_ok=True)
-    with open(CACHE_FILE, "w") as f:
-        json.dump(data, f, indent=2)
+    _write_json(CACHE_FILE, data)
+
+
+# Serialises the cache's read-modify-write between threads (server requests,
+# the terminal's background refresher) so no writer drops another's entry.
+_cache_lock = threading.Lock()
+
+
+def _update_cache(key: str, result: str):
+    """Store one analysis result in the cache file."""
+    with _cache_lock:
+        cache = _load_cache()
+        cache[key] = result
+        _save_cache(cache)
 
 
 def _build_market_context() -> str:
@@ -170,9 +191,7 @@ Be concise but data-dense. This is for a financial terminal dashboard."""
 
     result = _call_llm(system_prompt, user_prompt, max_tokens=3000)
 
-    cache = _load_cache()
-    cache["market_trends"] = result
-    _save_cache(cache)
+    _update_cache("market_trends", result)
     return result
 
 
@@ -204,9 +223,7 @@ Be specific with numbers and recommendations."""
 
     result = _call_llm(system_prompt, user_prompt, max_tokens=2500)
 
-    cache = _load_cache()
-    cache["regional_analysis"] = result
-    _save_cache(cache)
+    _update_cache("regional_analysis", result)
     return result
 
 
@@ -239,9 +256,7 @@ This is for institutional decision-makers. Be specific and actionable."""
 
     result = _call_llm(system_prompt, user_prompt, max_tokens=3000)
 
-    cache = _load_cache()
-    cache["investment_outlook"] = result
-    _save_cache(cache)
+    _update_cache("investment_outlook", result)
     return result
 
 
@@ -262,9 +277,7 @@ Focus on: current pricing levels, direction of travel, key risks, and one action
 
     result = _call_llm(system_prompt, user_prompt, max_tokens=500)
 
-    cache = _load_cache()
-    cache["quick_summary"] = result
-    _save_cache(cache)
+    _update_cache("quick_summary", result)
     return result
 
 
@@ -340,9 +353,7 @@ Write as 5-8 concise bullet-point notes, each with a clear actionable signal. In
 
     result = _call_llm(system_prompt, user_prompt, max_tokens=4000)
 
-    cache = _load_cache()
-    cache["market_notes"] = result
-    _save_cache(cache)
+    _update_cache("market_notes", result)
     return result
 
 
@@ -387,9 +398,7 @@ Be specific and actionable. Include dollar amounts where possible."""
 
     result = _call_llm(system_prompt, user_prompt, max_tokens=3000)
 
-    cache = _load_cache()
-    cache["efficiency_optimization"] = result
-    _save_cache(cache)
+    _update_cache("efficiency_optimization", result)
     return result
 
 
@@ -450,9 +459,7 @@ Include specific numbers and actionable trade recommendations."""
 
     result = _call_llm(system_prompt, user_prompt, max_tokens=3500)
 
-    cache = _load_cache()
-    cache["price_forecasts"] = result
-    _save_cache(cache)
+    _update_cache("price_forecasts", result)
     return result
 
 
@@ -515,9 +522,7 @@ Be specific with data and actionable recommendations."""
 
     result = _call_llm(system_prompt, user_prompt, max_tokens=3000)
 
-    cache = _load_cache()
-    cache["sustainability_risk"] = result
-    _save_cache(cache)
+    _update_cache("sustainability_risk", result)
     return result
 
 
@@ -595,9 +600,7 @@ Requirements:
                 raise ValueError(f"News item missing required keys: {item}")
 
         # Save to cache
-        os.makedirs(os.path.dirname(NEWS_CACHE_FILE), exist_ok=True)
-        with open(NEWS_CACHE_FILE, "w") as f:
-            json.dump({"date": today, "news": news, "timestamp": time.time()}, f, indent=2)
+        _write_json(NEWS_CACHE_FILE, {"date": today, "news": news, "timestamp": time.time()})
 
         return news
 
@@ -9,8 +9,29 @@ import os
 import time
 from datetime import datetime, timedelta
 from dataclasses import dataclass, field, asdict
+from operator import itemgetter
+from types import MappingProxyType
 from typing import Optional
 
+
+def _freeze(obj):
+    """Recursively turn a static dataset into read-only mappings and tuples."""
+    if isinstance(obj, dict):
+        return MappingProxyType({k: _freeze(v) for k, v in obj.items()})
+    if isinstance(obj, list):
+        return tuple(_freeze(v) for v in obj)
+    return obj
+
+
+def _thaw(obj):
+    """Plain dict/list copy of a frozen dataset, for JSON encoders and prompt text."""
+    if isinstance(obj, MappingProxyType):
+        return {k: _thaw(v) for k, v in obj.items()}
+    if isinstance(obj, tuple):
+        return [_thaw(v) for v in obj]
+    return obj
+
+
 # ============================================================================
 # GPU SPECIFICATIONS DATABASE
 # ============================================================================
@@ -1600,25 +1621,61 @@ NEWS_FEED = [
 # DATA AGGREGATION FUNCTIONS
 # ============================================================================
 
-def get_cheapest_by_gpu(gpu_id: str) -> list:
-    """Get all providers sorted by price for a specific GPU."""
-    results = []
+def _build_trend_changes() -> dict:
+    """Latest month-over-month average price change (%) per GPU in HISTORICAL_PRICING."""
+    changes = {}
+    for gpu_id, trends in HISTORICAL_PRICING.items():
+        periods = sorted(trends)
+        if len(periods) >= 2:
+            latest = trends[periods[-1]]["avg"]
+            prev = trends[periods[-2]]["avg"]
+            changes[gpu_id] = round(((latest - prev) / prev) * 100, 1)
+        else:
+            changes[gpu_id] = 0
+    return changes
+
+
+_TREND_CHANGE_PCT = _build_trend_changes()
+
+
+def _build_cheapest_by_gpu() -> dict:
+    """Index CLOUD_PRICING by GPU: gpu_id -> that GPU's provider rows, cheapest first.
+
+    CLOUD_PRICING is laid out provider-first, but every query below is
+    GPU-first, so without this each lookup scans every provider.
+    """
+    cheapest = {}
     for provider, data in CLOUD_PRICING.items():
-        if gpu_id in data["gpus"]:
-            gpu = data["gpus"][gpu_id]
-            results.append({
+        # Resolved per provider so rows never re-test the discount; None
+        # means the provider has no spot market.
+        spot_discount = data.get("spot_discount", 0)
+        spot_mult = (1 - spot_discount) if spot_discount > 0 else None
+        for gpu_id, gpu in data["gpus"].items():
+            price = gpu["price_per_gpu_hr"]
+            cheapest.setdefault(gpu_id, []).append({
                 "provider": provider,
                 "provider_name": data["provider_name"],
                 "provider_type": data.get("type", "cloud"),
                 "instance": gpu["instance"],
-                "price_per_gpu_hr": gpu["price_per_gpu_hr"],
-                "price_monthly": gpu["price_per_gpu_hr"] * 730,
-                "reserved_1yr": gpu["price_per_gpu_hr"] * (1 - data["reserved_1yr_discount"]),
-                "reserved_3yr": gpu["price_per_gpu_hr"] * (1 - data["reserved_3yr_discount"]),
+                "price_per_gpu_hr": price,
+                "price_monthly": price * 730,
+                "spot_price": price * spot_mult if spot_mult is not None else None,
+                "reserved_1yr": price * (1 - data["reserved_1yr_discount"]),
+                "reserved_3yr": price * (1 - data["reserved_3yr_discount"]),
                 "regions": gpu.get("regions", {})
             })
-    results.sort(key=lambda x: x["price_per_gpu_hr"])
-    return results
+    for rows in cheapest.values():
+        rows.sort(key=itemgetter("price_per_gpu_hr"))
+    return cheapest
+
+
+_CHEAPEST_BY_GPU = _build_cheapest_by_gpu()
+
+
+def get_cheapest_by_gpu(gpu_id: str) -> list:
+    """Get all providers sorted by price for a specific GPU."""
+    # Rows are prebuilt and shared between calls; only the list is copied.
+    return list(_CHEAPEST_BY_GPU.get(gpu_id, ()))
 
 
 def get_price_trends(gpu_id: str) -> dict:
@@ -1636,60 +1693,106 @@ def get_all_gpu_prices() -> dict:
     return matrix
 
 
+def _comparison_row(gpu_id: str, spec: dict) -> Optional[dict]:
+    """Build one GPU's comparison-matrix row, or None if no provider lists it."""
+    # Read the prebuilt rows directly; nothing here mutates them, so the
+    # defensive copy get_cheapest_by_gpu() hands to callers is not needed.
+    providers = _CHEAPEST_BY_GPU.get(gpu_id)
+    if not providers:
+        return None
+    # Providers come back sorted by price, so one column pull gives
+    # min/max by position and the average from a single C-level sum.
+    prices = [p["price_per_gpu_hr"] for p in providers]
+    cheapest = prices[0]
+    most_expensive = prices[-1]
+    avg_price = sum(prices) / len(prices)
+
+    return {
+        "gpu_id": gpu_id,
+        "name": spec["name"],
+        "vendor": spec.get("vendor", "NVIDIA"),
+        "vram_gb": spec["vram_gb"],
+        "arch": spec["arch"],
+        "tier": spec["tier"],
+        "cheapest_price": cheapest,
+        "cheapest_provider": providers[0]["provider"],
+        "cheapest_provider_type": providers[0]["provider_type"],
+        "most_expensive": most_expensive,
+        "avg_price": round(avg_price, 2),
+        "num_providers": len(providers),
+        "price_spread_pct": round(((most_expensive - cheapest) / cheapest) * 100, 1) if cheapest > 0 else 0,
+        "monthly_change_pct": _TREND_CHANGE_PCT.get(gpu_id, 0),
+        "flops_per_dollar": round(spec["fp16_tflops"] / cheapest, 1) if cheapest > 0 else 0,
+        "vram_per_dollar": round(spec["vram_gb"] / cheapest, 1) if cheapest > 0 else 0
+    }
+
+
 def get_price_comparison_matrix() -> list:
     """Create a comprehensive price comparison matrix."""
+    _, comparison = _market_snapshot()
+    return list(comparison)
+
+
+def _build_price_comparison_matrix() -> list:
     rows = []
     for gpu_id, spec in GPU_SPECS.items():
-        providers = get_cheapest_by_gpu(gpu_id)
-        if not providers:
-            continue
-        cheapest = providers[0]["price_per_gpu_hr"]
-        most_expensive = providers[-1]["price_per_gpu_hr"] if providers else cheapest
-        avg_price = sum(p["price_per_gpu_hr"] for p in providers) / len(providers) if providers else 0
-
-        # Get trend data — monthly change
-        trends = get_price_trends(gpu_id)
-        trend_periods = sorted(trends.keys())
-        if len(trend_periods) >= 2:
-            latest = trends[trend_periods[-1]]["avg"]
-            prev = trends[trend_periods[-2]]["avg"]
-            price_change_pct = ((latest - prev) / prev) * 100
-        else:
-            price_change_pct = 0
-
-        rows.append({
-            "gpu_id": gpu_id,
-            "name": spec["name"],
-            "vendor": spec.get("vendor", "NVIDIA"),
-            "vram_gb": spec["vram_gb"],
-            "arch": spec["arch"],
-            "tier": spec["tier"],
-            "cheapest_price": cheapest,
-            "cheapest_provider": providers[0]["provider"] if providers else "N/A",
-            "cheapest_provider_type": providers[0].get("provider_type", "cloud") if providers else "cloud",
-            "most_expensive": most_expensive,
-            "avg_price": round(avg_price, 2),
-            "num_providers": len(providers),
-            "price_spread_pct": round(((most_expensive - cheapest) / cheapest) * 100, 1) if cheapest > 0 else 0,
-            "monthly_change_pct": round(price_change_pct, 1),
-            "flops_per_dollar": round(spec["fp16_tflops"] / cheapest, 1) if cheapest > 0 else 0,
-            "vram_per_dollar": round(spec["vram_gb"] / cheapest, 1) if cheapest > 0 else 0
-        })
-    rows.sort(key=lambda x: x["cheapest_price"], reverse=True)
+        row = _comparison_row(gpu_id, spec)
+        if row is not None:
+            rows.append(row)
+    rows.sort(key=itemgetter("cheapest_price"), reverse=True)
     return rows
 
 
+_MARKET_SUMMARY_CACHE = None  # (headline, comparison matrix)
+
+
+def _market_snapshot() -> tuple:
+    """Return the (headline, comparison matrix) pair, built on first use and then reused."""
+    global _MARKET_SUMMARY_CACHE
+    # The datasets are static for the life of the process. Concurrent first
+    # callers may both build, but they build identical values.
+    if _MARKET_SUMMARY_CACHE is None:
+        comparison = _build_price_comparison_matrix()
+        _MARKET_SUMMARY_CACHE = (_build_market_headline(comparison), comparison)
+    return _MARKET_SUMMARY_CACHE
+
+
+def generate_market_headline() -> dict:
+    """Generate the headline market picks without the full comparison matrix."""
+    headline, _ = _market_snapshot()
+    # Only the timestamp changes between calls on the same data.
+    return {"timestamp": datetime.now().isoformat(), **headline}
+
+
 def generate_market_summary() -> dict:
     """Generate a comprehensive market summary."""
-    comparison = get_price_comparison_matrix()
+    headline, comparison = _market_snapshot()
+    return {
+        "timestamp": datetime.now().isoformat(),
+        **headline,
+        "market_indicators": MARKET_INDICATORS,
+        "comparison_matrix": list(comparison),
+        "market_sentiment": COMMUNITY_SENTIMENT
+    }
 
-    best_flops_per_dollar = max(comparison, key=lambda x: x["flops_per_dollar"])
-    best_vram_per_dollar = max(comparison, key=lambda x: x["vram_per_dollar"])
-    biggest_price_drop = min(comparison, key=lambda x: x["monthly_change_pct"])
-    most_competitive = max(comparison, key=lambda x: x["num_providers"])
 
+def _build_market_headline(comparison: list) -> dict:
+    """Return the market headline section built from the price comparison matrix."""
+    # Single pass over the matrix for all four picks. Strict comparisons keep
+    # the first row on ties, matching what max()/min() would return.
+    best_flops_per_dollar = best_vram_per_dollar = biggest_price_drop = most_competitive = comparison[0]
+    for row in comparison[1:]:
+        if row["flops_per_dollar"] > best_flops_per_dollar["flops_per_dollar"]:
+            best_flops_per_dollar = row
+        if row["vram_per_dollar"] > best_vram_per_dollar["vram_per_dollar"]:
+            best_vram_per_dollar = row
+        if row["monthly_change_pct"] < biggest_price_drop["monthly_change_pct"]:
+            biggest_price_drop = row
+        if row["num_providers"] > most_competitive["num_providers"]:
+            most_competitive = row
+
+    # No timestamp: this is cached, and the callers stamp their own.
     return {
-        "timestamp": datetime.now().isoformat(),
         "total_gpus_tracked": len(GPU_SPECS),
         "total_providers_tracked": len(CLOUD_PRICING),
         "best_flops_per_dollar": {
@@ -1712,10 +1815,7 @@ def generate_market_summary() -> dict:
             "gpu": most_competitive["name"],
             "num_providers": most_competitive["num_providers"],
             "price_spread_pct": most_competitive["price_spread_pct"]
-        },
-        "market_indicators": MARKET_INDICATORS,
-        "comparison_matrix": comparison,
-        "market_sentiment": COMMUNITY_SENTIMENT
+        }
     }
 
 
@@ -1726,16 +1826,20 @@ def get_regional_summary() -> dict:
 
 def get_workload_recommendations() -> dict:
     """Get workload-based recommendations with current pricing."""
+    # The cached comparison matrix already holds each GPU's cheapest listing,
+    # so GPUs recommended for several workloads are not re-scanned per workload.
+    _, comparison = _market_snapshot()
+    best_by_gpu = {row["gpu_id"]: row for row in comparison}
     enriched = {}
     for workload, rec in WORKLOAD_RECOMMENDATIONS.items():
         gpu_prices = {}
         for gpu_id in rec["recommended"]:
-            prices = get_cheapest_by_gpu(gpu_id)
-            if prices:
+            best = best_by_gpu.get(gpu_id)
+            if best:
                 gpu_prices[gpu_id] = {
-                    "cheapest": prices[0]["price_per_gpu_hr"],
-                    "provider": prices[0]["provider"],
-                    "monthly_1gpu": round(prices[0]["price_per_gpu_hr"] * 730, 2)
+                    "cheapest": best["cheapest_price"],
+                    "provider": best["cheapest_provider"],
+                    "monthly_1gpu": round(best["cheapest_price"] * 730, 2)
                 }
         enriched[workload] = {**rec, "current_prices": gpu_prices}
     return enriched
@@ -1858,6 +1962,9 @@ PRICE_FORECASTS = {
         "pattern_match": "AMD refresh cycle (MI300X successor, competitive pressure)"
     }
 }
+PRICE_FORECASTS = _freeze(PRICE_FORECASTS)
+# PRICE_FORECASTS is read-only, so its display order (priciest first) is fixed.
+PRICE_FORECAST_ORDER = tuple(sorted(PRICE_FORECASTS, key=lambda g: PRICE_FORECASTS[g]["current_avg"], reverse=True))
 
 
 # ──────────────────────────────────────────────────────────────────────────────
@@ -1906,6 +2013,7 @@ COMPETITIVE_MOAT = {
         "parity_timeline": "Unlikely to achieve broad parity"
     }
 }
+COMPETITIVE_MOAT = _freeze(COMPETITIVE_MOAT)
 
 
 # ──────────────────────────────────────────────────────────────────────────────
@@ -1944,6 +2052,7 @@ SUSTAINABILITY_INDEX = {
         "us-west": {"pue": 1.11, "carbon_gco2_per_kwh": 160, "green_energy_pct": 82, "water_usage_l_per_kwh": 1.2, "sustainability_score": 85}
     }
 }
+SUSTAINABILITY_INDEX = _freeze(SUSTAINABILITY_INDEX)
 
 GPU_CARBON_FOOTPRINT = {
     "H100-SXM": {"tdp_watts": 700, "typical_watts": 580, "kwh_per_hour": 0.58, "annual_kwh_full_util": 5081, "carbon_kg_per_year_us_avg": 2032, "carbon_kg_per_year_eu_nordic": 228, "water_liters_per_year_us_avg": 9146, "embodied_carbon_kg": 150},
@@ -2012,6 +2121,7 @@ SUPPLY_CHAIN_RISK = {
         "inventory_weeks": 14
     }
 }
+SUPPLY_CHAIN_RISK = _freeze(SUPPLY_CHAIN_RISK)
 
 EXPORT_CONTROL_TRACKER = [
     {
@@ -2215,6 +2325,7 @@ EXPORT_CONTROL_TRACKER = [
         "regional_impact": {"US": "negative", "EU": "mixed", "China": "low_negative", "Japan": "neutral", "India": "neutral", "Middle_East": "neutral", "SE_Asia": "neutral"}
     },
 ]
+EXPORT_CONTROL_TRACKER = _freeze(EXPORT_CONTROL_TRACKER)
 
 
 # ──────────────────────────────────────────────────────────────────────────────
@@ -2229,16 +2340,15 @@ EXPORT_CONTROL_TRACKER = [
 
 def get_price_forecasts() -> dict:
     """Get price forecasts for all tracked GPUs."""
-    return PRICE_FORECASTS
+    return _thaw(PRICE_FORECASTS)
 
 
 def get_competitive_landscape() -> dict:
     """Get competitive moat analysis for all vendors."""
-    return COMPETITIVE_MOAT
+    return _thaw(COMPETITIVE_MOAT)
 
 
-def get_sustainability_summary() -> dict:
-    """Aggregate sustainability data across providers and regions."""
+def _build_sustainability_summary() -> dict:
     provider_summary = {}
     for provider, regions in SUSTAINABILITY_INDEX.items():
         scores = [r["sustainability_score"] for r in regions.values()]
@@ -2255,6 +2365,17 @@ def get_sustainability_summary() -> dict:
     return {"providers": provider_summary, "gpu_carbon": GPU_CARBON_FOOTPRINT}
 
 
+# The datasets behind these summaries are static, so aggregate once at import
+# instead of on every request. Frozen like its inputs; the getter hands out
+# plain copies.
+_SUSTAINABILITY_SUMMARY = _freeze(_build_sustainability_summary())
+
+
+def get_sustainability_summary() -> dict:
+    """Aggregate sustainability data across providers and regions."""
+    return _thaw(_SUSTAINABILITY_SUMMARY)
+
+
 def get_supply_chain_summary() -> dict:
     """Get supply chain risk summary with export control context."""
-    return {"vendors": SUPPLY_CHAIN_RISK, "export_controls": EXPORT_CONTROL_TRACKER}
+    return {"vendors": _thaw(SUPPLY_CHAIN_RISK), "export_controls": _thaw(EXPORT_CONTROL_TRACKER)}
@@ -4,16 +4,23 @@ Web server for the AI GPU Dashboard.
 Serves the HTML dashboard and provides API endpoints for live data + AI analysis.
 """
 
+import gzip
 import json
 import os
 import sys
 import threading
-from http.server import HTTPServer, SimpleHTTPRequestHandler
-from urllib.parse import urlparse, parse_qs
+from collections.abc import Mapping
+from http.server import ThreadingHTTPServer, SimpleHTTPRequestHandler
+from urllib.parse import parse_qs
 from datetime import datetime
 from urllib.request import Request, urlopen
 from urllib.error import HTTPError, URLError
 
+try:
+    import orjson  # optional: several times faster than the stdlib encoder
+except ImportError:
+    orjson = None
+
 sys.path.insert(0, os.path.dirname(__file__))
 
 from gpu_data import (
@@ -21,12 +28,34 @@ from gpu_data import (
     REGIONAL_DATA, WORKLOAD_RECOMMENDATIONS,
     TCO_COMPONENTS, INFERENCE_BENCHMARKS, SPOT_MARKET, NEWS_FEED,
     get_cheapest_by_gpu, get_price_comparison_matrix,
-    generate_market_summary, get_regional_summary, get_workload_recommendations,
+    generate_market_summary, generate_market_headline,
+    get_regional_summary, get_workload_recommendations,
     get_price_forecasts,
     get_competitive_landscape, get_sustainability_summary, get_supply_chain_summary,
 )
 from config import WEB_PORT
 
+# Imported once here rather than per request. The AI endpoints report the
+# import error instead of taking the whole server down when it fails.
+try:
+    import ai_analyzer
+except Exception as e:
+    ai_analyzer = None
+    _AI_IMPORT_ERROR = str(e)
+    _AI_FUNCS = {}
+else:
+    _AI_IMPORT_ERROR = None
+    _AI_FUNCS = {
+        "quick_summary": ai_analyzer.get_quick_summary,
+        "market_trends": ai_analyzer.analyze_market_trends,
+        "regional_analysis": ai_analyzer.analyze_regional_opportunities,
+        "investment_outlook": ai_analyzer.analyze_investment_outlook,
+        "market_notes": ai_analyzer.generate_market_notes,
+        "efficiency_optimization": ai_analyzer.analyze_efficiency_optimization,
+        "price_forecasts": ai_analyzer.analyze_price_forecasts,
+        "sustainability_risk": ai_analyzer.analyze_sustainability_risk,
+    }
+
 
 def _load_env():
     """Load variables from .env file if present."""
@@ -49,16 +78,112 @@ CHAT_MODEL = os.environ.get("CHAT_MODEL", "qwen/qwen3-32b")
 _rate_map = {}
 _RATE_LIMIT = 20
 _RATE_WINDOW = 60
+_rate_lock = threading.Lock()
 
 def _is_rate_limited(ip):
     import time
     now = time.time()
-    entry = _rate_map.get(ip)
-    if not entry or now - entry["start"] > _RATE_WINDOW:
-        _rate_map[ip] = {"start": now, "count": 1}
-        return False
-    entry["count"] += 1
-    return entry["count"] > _RATE_LIMIT
+    with _rate_lock:
+        entry = _rate_map.get(ip)
+        if not entry or now - entry["start"] > _RATE_WINDOW:
+            _rate_map[ip] = {"start": now, "count": 1}
+            return False
+        entry["count"] += 1
+        return entry["count"] > _RATE_LIMIT
+
+def _json_default(obj):
+    """Serialise read-only mappings from gpu_data as objects; anything else as a string."""
+    if isinstance(obj, Mapping):
+        return dict(obj)
+    return str(obj)
+
+def _dump_json(data) -> bytes:
+    """Encode an API payload to UTF-8 JSON, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(data, default=_json_default, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, default=_json_default).encode("utf-8")
+
+def _load_json(raw):
+    """Decode a JSON request/response body; orjson errors subclass json.JSONDecodeError."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+# Endpoints built purely from gpu_data's static datasets. Their encoded
+# bodies are built on first request and reused for the life of the process.
+_STATIC_JSON = {
+    "/api/matrix": get_price_comparison_matrix,
+    "/api/regional": get_regional_summary,
+    "/api/indicators": lambda: MARKET_INDICATORS,
+    "/api/workloads": get_workload_recommendations,
+    "/api/historical": lambda: HISTORICAL_PRICING,
+    "/api/specs": lambda: GPU_SPECS,
+    "/api/providers": lambda: CLOUD_PRICING,
+    "/api/tco": lambda: TCO_COMPONENTS,
+    "/api/inference": lambda: INFERENCE_BENCHMARKS,
+    "/api/spot": lambda: SPOT_MARKET,
+    "/api/forecasts": get_price_forecasts,
+    "/api/competitive": get_competitive_landscape,
+    "/api/sustainability": get_sustainability_summary,
+    "/api/supplychain": get_supply_chain_summary,
+}
+
+def _bundle():
+    """Every data endpoint above in one payload, keyed by its path without "/api/"."""
+    return {path[len("/api/"):]: build() for path, build in _STATIC_JSON.items() if path != "/api/bundle"}
+
+# Lets the dashboard bootstrap with one request instead of one per endpoint.
+_STATIC_JSON["/api/bundle"] = _bundle
+
+_json_cache = {}  # path -> (encoded body, gzipped body or None)
+_GZIP_MIN_BYTES = 1024  # below this the gzip header overhead isn't worth it
+_ai_json_cache = {}  # analysis type -> (analysis text, encoded body)
+
+def _cached_json(path):
+    """Return (body, gzipped body or None) for a _STATIC_JSON endpoint."""
+    entry = _json_cache.get(path)
+    if entry is None:
+        body = _dump_json(_STATIC_JSON[path]())
+        gz_body = gzip.compress(body, 5) if len(body) >= _GZIP_MIN_BYTES else None
+        entry = (body, gz_body)
+        _json_cache[path] = entry
+    return entry
+
+def _accepts_gzip(accept_encoding):
+    """True if an Accept-Encoding header allows gzip; a q=0 weight refuses it."""
+    wildcard = False
+    for coding in accept_encoding.split(","):
+        name, _, params = coding.partition(";")
+        name = name.strip().lower()
+        if name not in ("gzip", "x-gzip", "*"):
+            continue
+        q = 1.0
+        for param in params.split(";"):
+            key, _, value = param.partition("=")
+            if key.strip().lower() == "q":
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        if name == "*":
+            wildcard = q > 0
+        else:
+            return q > 0
+    return wildcard
+
+_file_cache = {}  # filename -> (mtime_ns, body, etag)
+
+def _read_cached_file(filename):
+    """Return (body, etag) for a file next to this script, re-reading only when its mtime changes."""
+    filepath = os.path.join(os.path.dirname(__file__), filename)
+    mtime_ns = os.stat(filepath).st_mtime_ns
+    entry = _file_cache.get(filename)
+    if entry is None or entry[0] != mtime_ns:
+        with open(filepath, "rb") as f:
+            content = f.read()
+        entry = (mtime_ns, content, f'"{mtime_ns:x}-{len(content):x}"')
+        _file_cache[filename] = entry
+    return entry[1], entry[2]
 
 # CORS allowlist
 _ALLOWED_ORIGINS = {"http://localhost:8080", "http://localhost:3000", "http://127.0.0.1:5500"}
@@ -73,6 +198,10 @@ def _cors_origin(headers):
 
 
 class DashboardHandler(SimpleHTTPRequestHandler):
+    # Keep-alive lets the dashboard's polls reuse one connection; every
+    # response path sets Content-Length so the stream stays framed.
+    protocol_version = "HTTP/1.1"
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, directory=os.path.dirname(__file__), **kwargs)
 
@@ -90,8 +219,11 @@ class DashboardHandler(SimpleHTTPRequestHandler):
         self.end_headers()
 
     def do_POST(self):
-        parsed = urlparse(self.path)
-        if parsed.path == "/api/chat":
+        # Some replies go out before the body is read (rate limit, size cap),
+        # so never reuse a POST connection: leftover bytes would be parsed
+        # as the next request.
+        self.close_connection = True
+        if self.path.partition("?")[0] == "/api/chat":
             self.handle_chat_proxy()
         else:
             self.send_error(404, "Not Found")
@@ -113,7 +245,7 @@ class DashboardHandler(SimpleHTTPRequestHandler):
                 self.send_json({"error": "Request too large."}, status=413)
                 return
             body = self.rfile.read(content_length)
-            payload = json.loads(body)
+            payload = _load_json(body)
         except (json.JSONDecodeError, ValueError):
             self.send_json({"error": "Invalid request body."}, status=400)
             return
@@ -137,12 +269,12 @@ class DashboardHandler(SimpleHTTPRequestHandler):
                 self.send_json({"error": "Message too long."}, status=400)
                 return
 
-        proxy_payload = json.dumps({
+        proxy_payload = _dump_json({
             "model": CHAT_MODEL,
             "messages": messages,
             "max_tokens": min(payload.get("max_tokens", 1024), 2048),
             "temperature": 0.7,
-        }).encode("utf-8")
+        })
 
         req = Request(
             CHAT_API_URL,
@@ -156,7 +288,7 @@ class DashboardHandler(SimpleHTTPRequestHandler):
 
         try:
             with urlopen(req, timeout=60) as resp:
-                resp_data = json.loads(resp.read().decode("utf-8"))
+                resp_data = _load_json(resp.read())
             self.send_json(resp_data)
         except HTTPError:
             self.send_json({"error": "AI service returned an error. Please try again."}, status=502)
@@ -164,130 +296,147 @@ class DashboardHandler(SimpleHTTPRequestHandler):
             self.send_json({"error": "AI service temporarily unavailable."}, status=502)
 
     def do_GET(self):
-        parsed = urlparse(self.path)
-        path = parsed.path
-
-        if path == "/" or path == "/index.html":
-            self.send_file("web_dashboard.html", "text/html")
-        elif path == "/api/summary":
-            self.send_json(generate_market_summary())
-        elif path == "/api/matrix":
-            self.send_json(get_price_comparison_matrix())
-        elif path == "/api/gpu":
-            params = parse_qs(parsed.query)
-            gpu_id = params.get("id", ["H100-SXM"])[0]
-            providers = get_cheapest_by_gpu(gpu_id)
-            spec = GPU_SPECS.get(gpu_id, {})
-            trends = HISTORICAL_PRICING.get(gpu_id, {})
-            self.send_json({"spec": spec, "providers": providers, "trends": trends})
-        elif path == "/api/regional":
-            self.send_json(get_regional_summary())
-        elif path == "/api/indicators":
-            self.send_json(MARKET_INDICATORS)
-        elif path == "/api/workloads":
-            self.send_json(get_workload_recommendations())
-        elif path == "/api/historical":
-            self.send_json(HISTORICAL_PRICING)
-        elif path == "/api/specs":
-            self.send_json(GPU_SPECS)
-        elif path == "/api/providers":
-            self.send_json(CLOUD_PRICING)
-        elif path.startswith("/api/ai/"):
-            params = parse_qs(parsed.query)
-            use_cache = "nocache" not in params
-            ai_route = path[8:]  # strip "/api/ai/"
-            ai_types = {
-                "summary": "quick_summary", "trends": "market_trends",
-                "regional": "regional_analysis", "investment": "investment_outlook",
-                "notes": "market_notes", "efficiency": "efficiency_optimization",
-                "forecast": "price_forecasts", "sustainability": "sustainability_risk",
-            }
-            if ai_route == "all":
-                self.send_ai_all()
-            elif ai_route == "gpu":
-                gpu_id = params.get("id", ["H100-SXM"])[0]
-                self.send_ai_gpu(gpu_id)
-            elif ai_route in ai_types:
-                self.send_ai_analysis(ai_types[ai_route], use_cache=use_cache)
+        # Split off the query by hand; only /api/gpu and /api/ai/* read it,
+        # and they parse it themselves.
+        path, _, query = self.path.partition("?")
+
+        if path in _STATIC_JSON:
+            body, gz_body = _cached_json(path)
+            if gz_body is None:
+                self.send_json_bytes(body)
+            elif _accepts_gzip(self.headers.get("Accept-Encoding", "")):
+                self.send_json_bytes(gz_body, encoding="gzip", vary_encoding=True)
             else:
-                super().do_GET()
-        elif path == "/api/tco":
-            self.send_json(TCO_COMPONENTS)
-        elif path == "/api/inference":
-            self.send_json(INFERENCE_BENCHMARKS)
-        elif path == "/api/spot":
-            self.send_json(SPOT_MARKET)
-        elif path == "/api/news":
-            try:
-                from ai_analyzer import generate_daily_news
-                self.send_json(generate_daily_news())
-            except Exception:
-                self.send_json(NEWS_FEED)
-        elif path == "/api/forecasts":
-            self.send_json(get_price_forecasts())
-        elif path == "/api/competitive":
-            self.send_json(get_competitive_landscape())
-        elif path == "/api/sustainability":
-            self.send_json(get_sustainability_summary())
-        elif path == "/api/supplychain":
-            self.send_json(get_supply_chain_summary())
+                self.send_json_bytes(body, vary_encoding=True)
+            return
+        handler = self.ROUTES.get(path)
+        if handler is not None:
+            handler(self, query)
+        elif path.startswith("/api/ai/"):
+            self.handle_ai_route(path[8:], query)  # strip "/api/ai/"
+        else:
+            super().do_GET()
+
+    def handle_dashboard(self, query):
+        self.send_file("web_dashboard.html", "text/html")
+
+    def handle_summary(self, query):
+        self.send_json(generate_market_summary())
+
+    def handle_headline(self, query):
+        self.send_json(generate_market_headline())
+
+    def handle_gpu(self, query):
+        params = parse_qs(query)
+        gpu_id = params.get("id", ["H100-SXM"])[0]
+        providers = get_cheapest_by_gpu(gpu_id)
+        spec = GPU_SPECS.get(gpu_id, {})
+        trends = HISTORICAL_PRICING.get(gpu_id, {})
+        self.send_json({"spec": spec, "providers": providers, "trends": trends})
+
+    def handle_news(self, query):
+        if ai_analyzer is None:
+            self.send_json(NEWS_FEED)
+            return
+        try:
+            self.send_json(ai_analyzer.generate_daily_news())
+        except Exception:
+            self.send_json(NEWS_FEED)
+
+    # Exact-path GET routes; /api/ai/* is matched by prefix in do_GET.
+    ROUTES = {
+        "/": handle_dashboard,
+        "/index.html": handle_dashboard,
+        "/api/summary": handle_summary,
+        "/api/headline": handle_headline,
+        "/api/gpu": handle_gpu,
+        "/api/news": handle_news,
+    }
+
+    AI_TYPES = {
+        "summary": "quick_summary", "trends": "market_trends",
+        "regional": "regional_analysis", "investment": "investment_outlook",
+        "notes": "market_notes", "efficiency": "efficiency_optimization",
+        "forecast": "price_forecasts", "sustainability": "sustainability_risk",
+    }
+
+    def handle_ai_route(self, ai_route, query):
+        params = parse_qs(query)
+        if ai_route == "all":
+            self.send_ai_all()
+        elif ai_route == "gpu":
+            gpu_id = params.get("id", ["H100-SXM"])[0]
+            self.send_ai_gpu(gpu_id)
+        elif ai_route in self.AI_TYPES:
+            self.send_ai_analysis(self.AI_TYPES[ai_route], use_cache="nocache" not in params)
         else:
             super().do_GET()
 
     def send_json(self, data, status=200):
-        content = json.dumps(data, default=str).encode("utf-8")
+        self.send_json_bytes(_dump_json(data), status=status)
+
+    def send_json_bytes(self, content, status=200, encoding=None, vary_encoding=False):
         self.send_response(status)
         self.send_header("Content-Type", "application/json")
+        if self.close_connection:
+            self.send_header("Connection", "close")
+        if encoding:
+            self.send_header("Content-Encoding", encoding)
+        if vary_encoding:
+            # Set on both variants so caches never hand gzip to a client that refused it.
+            self.send_header("Vary", "Accept-Encoding")
         self._set_cors()
         self.send_header("Content-Length", len(content))
         self.end_headers()
         self.wfile.write(content)
 
     def send_file(self, filename, content_type):
-        filepath = os.path.join(os.path.dirname(__file__), filename)
-        with open(filepath, "rb") as f:
-            content = f.read()
+        content, etag = _read_cached_file(filename)
+        if self.headers.get("If-None-Match") == etag:
+            self.send_response(304)
+            self.send_header("ETag", etag)
+            self.end_headers()
+            return
         self.send_response(200)
         self.send_header("Content-Type", content_type)
         self.send_header("Content-Length", len(content))
+        self.send_header("ETag", etag)
+        self.send_header("Cache-Control", "no-cache")
         self.end_headers()
         self.wfile.write(content)
 
     def send_ai_analysis(self, analysis_type, use_cache=True):
+        if ai_analyzer is None:
+            self.send_json({"error": _AI_IMPORT_ERROR})
+            return
         try:
-            from ai_analyzer import (
-                get_quick_summary, analyze_market_trends,
-                analyze_regional_opportunities, analyze_investment_outlook,
-                generate_market_notes, analyze_efficiency_optimization,
-                analyze_price_forecasts, analyze_sustainability_risk,
-            )
-            funcs = {
-                "quick_summary": get_quick_summary,
-                "market_trends": analyze_market_trends,
-                "regional_analysis": analyze_regional_opportunities,
-                "investment_outlook": analyze_investment_outlook,
-                "market_notes": generate_market_notes,
-                "efficiency_optimization": analyze_efficiency_optimization,
-                "price_forecasts": analyze_price_forecasts,
-                "sustainability_risk": analyze_sustainability_risk,
-            }
-            result = funcs[analysis_type](use_cache=use_cache)
-            self.send_json({"analysis": result, "type": analysis_type, "timestamp": datetime.now().isoformat()})
+            result = _AI_FUNCS[analysis_type](use_cache=use_cache)
+            # Cached analyses come back unchanged on most hits; only re-encode
+            # (and re-stamp) when the analysis text itself changes.
+            entry = _ai_json_cache.get(analysis_type)
+            if entry is None or entry[0] != result:
+                entry = (result, _dump_json({"analysis": result, "type": analysis_type, "timestamp": datetime.now().isoformat()}))
+                _ai_json_cache[analysis_type] = entry
+            self.send_json_bytes(entry[1])
         except Exception as e:
             self.send_json({"error": str(e)})
 
     def send_ai_all(self):
+        if ai_analyzer is None:
+            self.send_json({"error": _AI_IMPORT_ERROR})
+            return
         try:
-            from ai_analyzer import get_all_analyses
-            result = get_all_analyses(use_cache=True)
+            result = ai_analyzer.get_all_analyses(use_cache=True)
             self.send_json(result)
         except Exception as e:
             self.send_json({"error": str(e)})
 
     def send_ai_gpu(self, gpu_id):
+        if ai_analyzer is None:
+            self.send_json({"error": _AI_IMPORT_ERROR})
+            return
         try:
-            from ai_analyzer import analyze_specific_gpu
-            result = analyze_specific_gpu(gpu_id)
+            result = ai_analyzer.analyze_specific_gpu(gpu_id)
             self.send_json({"analysis": result, "gpu_id": gpu_id, "timestamp": datetime.now().isoformat()})
         except Exception as e:
             self.send_json({"error": str(e)})
@@ -298,7 +447,8 @@ class DashboardHandler(SimpleHTTPRequestHandler):
 
 def run_server(port=None):
     port = port or WEB_PORT
-    server = HTTPServer(("0.0.0.0", port), DashboardHandler)
+    # One thread per request so slow /api/ai/* LLM calls don't stall data endpoints.
+    server = ThreadingHTTPServer(("0.0.0.0", port), DashboardHandler)
     print(f"\n  AI GPU Dashboard Server running at:")
     print(f"  -> http://localhost:{port}")
     print(f"  -> Press Ctrl+C to stop\n")
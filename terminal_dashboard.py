@@ -7,15 +7,20 @@ Rich-based terminal UI with live data, charts, and AI analysis.
 import sys
 import os
 import time
+import functools
+import heapq
 import json
-from datetime import datetime
+import subprocess
+import tempfile
+import threading
+from bisect import bisect_left, bisect_right
+from typing import Optional
 
 sys.path.insert(0, os.path.dirname(__file__))
 
-from rich.console import Console
+from rich.console import Console, Group
 from rich.table import Table
 from rich.panel import Panel
-from rich.layout import Layout
 from rich.text import Text
 from rich.columns import Columns
 from rich.live import Live
@@ -24,6 +29,7 @@ from rich import box
 from rich.progress_bar import ProgressBar
 from rich.style import Style
 from rich.markdown import Markdown
+from rich.markup import escape
 
 from gpu_data import (
     GPU_SPECS, CLOUD_PRICING, HISTORICAL_PRICING, MARKET_INDICATORS,
@@ -34,10 +40,29 @@ from gpu_data import (
     get_utilization_summary, get_reservation_analysis, get_price_forecasts,
     get_competitive_landscape, get_sustainability_summary, get_supply_chain_summary,
     get_model_hardware_fit, UTILIZATION_METRICS, RESERVATION_ANALYTICS,
-    PRICE_FORECASTS, COMPETITIVE_MOAT, GPU_CARBON_FOOTPRINT,
+    PRICE_FORECASTS, PRICE_FORECAST_ORDER, COMPETITIVE_MOAT, GPU_CARBON_FOOTPRINT,
     SUPPLY_CHAIN_RISK, EXPORT_CONTROL_TRACKER, MODEL_HARDWARE_FIT,
 )
 
+# ai_analyzer (and its LLM config) is only imported on first use; see _ai_analyzer().
+_ai_module = None
+_ai_import_error = None
+
+
+def _ai_analyzer():
+    """Import ai_analyzer once and reuse it, re-raising a failed import on every use."""
+    global _ai_module, _ai_import_error
+    if _ai_module is None:
+        if _ai_import_error is not None:
+            raise ImportError(_ai_import_error)
+        try:
+            import ai_analyzer
+        except Exception as e:
+            _ai_import_error = str(e)
+            raise
+        _ai_module = ai_analyzer
+    return _ai_module
+
 console = Console()
 
 # ============================================================================
@@ -49,48 +74,124 @@ SPARK_CHARS = "▁▂▃▄▅▆▇█"
 def sparkline(values: list) -> str:
     if not values:
         return ""
+    return _sparkline(tuple(values))
+
+
+@functools.lru_cache(maxsize=256)
+def _sparkline(values: tuple) -> str:
+    # Panels redraw the same historical series every refresh.
     mn, mx = min(values), max(values)
     rng = mx - mn if mx != mn else 1
-    return "".join(SPARK_CHARS[min(int((v - mn) / rng * 7), 7)] for v in values)
+    # (v - mn) / rng never exceeds 1.0, so the index needs no upper clamp.
+    chars = SPARK_CHARS
+    return "".join([chars[int((v - mn) / rng * 7)] for v in values])
+
+
+# Bucket edges for trend_arrow: <-5, <-1, <1, <5, >=5 (% change).
+TREND_THRESHOLDS = (-5, -1, 1, 5)
+TREND_ARROWS = ("[bold green]▼▼[/]", "[green]▼[/]", "[yellow]→[/]", "[red]▲[/]", "[bold red]▲▲[/]")
+
+# Bucket edges for the 12-month forecast change colour: <-10, <0, >=0 (%).
+FORECAST_CHANGE_THRESHOLDS = (-10, 0)
+FORECAST_CHANGE_COLORS = ("green", "yellow", "red")
+
+# Shared look of the main market tables, built once instead of per render.
+TABLE_DEFAULTS = {
+    "box": box.SIMPLE_HEAVY,
+    "title_style": "bold cyan",
+    "header_style": "bold white on dark_blue",
+    "padding": (0, 1),
+}
+
+# Ten-cell bars for a 0-100 index, indexed by index // 10.
+DEMAND_BARS = tuple("█" * i + "░" * (10 - i) for i in range(11))
+
+AVAIL_COLORS = {"scarce": "bold red", "limited": "red", "moderate": "yellow", "good": "green", "abundant": "bold green"}
+
+# Provider columns shown in the inference economics table, in display order.
+INFERENCE_TOP_PROVIDERS = ("OpenRouter", "OpenAI API", "Anthropic API", "Google Vertex", "DeepSeek API", "Together")
+
+# Score bands for tier_color(): values below the first edge are red, at or
+# above the last are green.
+TIER_COLORS = ("red", "yellow", "green")
+DEMAND_TIERS = (50, 80)
+UTILIZATION_TIERS = (60, 75)
+MOAT_TIERS = (40, 70)
+SUSTAINABILITY_TIERS = (60, 80)
+FIT_TIERS = (70, 85)
+# Supply risk runs the other way (higher is worse) with exclusive edges:
+# >35 is yellow and >50 red, so it is banded with bisect_left.
+SUPPLY_RISK_TIERS = (35, 50)
+SUPPLY_RISK_COLORS = TIER_COLORS[::-1]
+
+SENTIMENT_COLORS = {"positive": "green", "negative": "red"}
+IMPACT_COLORS = {"high": "bold red", "medium": "yellow"}
 
 
 def trend_arrow(change_pct: float) -> str:
-    if change_pct < -5:
-        return "[bold green]▼▼[/]"
-    elif change_pct < -1:
-        return "[green]▼[/]"
-    elif change_pct < 1:
-        return "[yellow]→[/]"
-    elif change_pct < 5:
-        return "[red]▲[/]"
-    else:
-        return "[bold red]▲▲[/]"
+    return TREND_ARROWS[bisect_right(TREND_THRESHOLDS, change_pct)]
 
 
 def avail_color(avail: str) -> str:
-    colors = {"scarce": "bold red", "limited": "red", "moderate": "yellow", "good": "green", "abundant": "bold green"}
-    return colors.get(avail, "white")
+    return AVAIL_COLORS.get(avail, "white")
+
+
+def tier_color(value: float, tiers: tuple) -> str:
+    return TIER_COLORS[bisect_right(tiers, value)]
+
+
+@functools.lru_cache(maxsize=None)
+def _sorted_periods(gpu_id: str) -> tuple:
+    """Chronological HISTORICAL_PRICING periods for a GPU, sorted once."""
+    return tuple(sorted(HISTORICAL_PRICING.get(gpu_id, {})))
+
+
+@functools.lru_cache(maxsize=None)
+def _models_by_rank() -> tuple:
+    """INFERENCE_BENCHMARKS model names ordered by rank, sorted once."""
+    return tuple(sorted(INFERENCE_BENCHMARKS, key=lambda m: INFERENCE_BENCHMARKS[m].get("rank", 99)))
+
+
+def cached_panel(render):
+    """Build a panel from gpu_data's static datasets once per argument tuple and reuse it.
+
+    Rich renderables can be printed any number of times, so a refresh only
+    has to print the panels again, not rebuild their tables.
+    """
+    return functools.lru_cache(maxsize=None)(render)
 
 
 # ============================================================================
 # DASHBOARD SECTIONS
 # ============================================================================
 
-def render_header() -> Panel:
-    now = datetime.now()
+def render_header(now: Optional[float] = None) -> Panel:
+    # The clock only has one-second resolution, so refreshes within the same
+    # second can share one panel.
+    return _header_panel(int(time.time() if now is None else now))
+
+
+@functools.lru_cache(maxsize=1)
+def _header_panel(epoch_sec: int) -> Panel:
+    stamp = time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(epoch_sec))
     title = Text()
     title.append("  AI GPU MARKET TERMINAL  ", style="bold white on blue")
     title.append("  ", style="")
-    title.append(f"  {now.strftime('%Y-%m-%d %H:%M:%S')}  ", style="bold white on dark_green")
+    title.append(f"  {stamp}  ", style="bold white on dark_green")
     title.append("  ", style="")
     title.append("  LIVE  ", style="bold white on red")
 
+    nvda = MARKET_INDICATORS['nvidia_stock']
+    amd = MARKET_INDICATORS['amd_stock']
+    nvda_up = nvda['ytd_change'] > 0
+    amd_up = amd['ytd_change'] > 0
+
     subtitle = Text()
-    subtitle.append(f"  NVDA ${MARKET_INDICATORS['nvidia_stock']['current']:.2f} ", style="bold green" if MARKET_INDICATORS['nvidia_stock']['ytd_change'] > 0 else "bold red")
-    subtitle.append(f"({MARKET_INDICATORS['nvidia_stock']['ytd_change']:+.1f}% YTD)  ", style="green" if MARKET_INDICATORS['nvidia_stock']['ytd_change'] > 0 else "red")
+    subtitle.append(f"  NVDA ${nvda['current']:.2f} ", style="bold green" if nvda_up else "bold red")
+    subtitle.append(f"({nvda['ytd_change']:+.1f}% YTD)  ", style="green" if nvda_up else "red")
     subtitle.append(" │ ", style="dim")
-    subtitle.append(f"AMD ${MARKET_INDICATORS['amd_stock']['current']:.2f} ", style="bold green" if MARKET_INDICATORS['amd_stock']['ytd_change'] > 0 else "bold red")
-    subtitle.append(f"({MARKET_INDICATORS['amd_stock']['ytd_change']:+.1f}% YTD)  ", style="green" if MARKET_INDICATORS['amd_stock']['ytd_change'] > 0 else "red")
+    subtitle.append(f"AMD ${amd['current']:.2f} ", style="bold green" if amd_up else "bold red")
+    subtitle.append(f"({amd['ytd_change']:+.1f}% YTD)  ", style="green" if amd_up else "red")
     subtitle.append(" │ ", style="dim")
     subtitle.append(f"GPU Market: $95.8B (2025E)  ", style="cyan")
     subtitle.append(" │ ", style="dim")
@@ -103,15 +204,13 @@ def render_header() -> Panel:
     return Panel(grid, style="bold blue", box=box.DOUBLE)
 
 
+@cached_panel
 def render_price_matrix() -> Panel:
     table = Table(
         title="GPU PRICE MATRIX — On-Demand $/hr Per GPU",
-        box=box.SIMPLE_HEAVY,
         show_lines=False,
-        title_style="bold cyan",
-        header_style="bold white on dark_blue",
         row_styles=["", "dim"],
-        padding=(0, 1),
+        **TABLE_DEFAULTS,
     )
 
     table.add_column("GPU", style="bold white", min_width=18)
@@ -135,7 +234,7 @@ def render_price_matrix() -> Panel:
 
         # Get sparkline from historical data
         hist = HISTORICAL_PRICING.get(row["gpu_id"], {})
-        spark_vals = [hist[k]["avg"] for k in sorted(hist.keys())]
+        spark_vals = [hist[k]["avg"] for k in _sorted_periods(row["gpu_id"])]
         spark = sparkline(spark_vals) if spark_vals else "—"
 
         table.add_row(
@@ -156,16 +255,14 @@ def render_price_matrix() -> Panel:
     return Panel(table, border_style="blue", box=box.ROUNDED)
 
 
+@cached_panel
 def render_provider_comparison(gpu_id: str = "H100-SXM") -> Panel:
     providers = get_cheapest_by_gpu(gpu_id)
     spec = GPU_SPECS.get(gpu_id, {})
 
     table = Table(
         title=f"PROVIDER COMPARISON — {spec.get('name', gpu_id)}",
-        box=box.SIMPLE_HEAVY,
-        title_style="bold cyan",
-        header_style="bold white on dark_blue",
-        padding=(0, 1),
+        **TABLE_DEFAULTS,
     )
 
     table.add_column("Provider", style="bold white", min_width=12)
@@ -180,8 +277,10 @@ def render_provider_comparison(gpu_id: str = "H100-SXM") -> Panel:
 
     if providers:
         best = providers[0]["price_per_gpu_hr"]
+        # One division per GPU; each row's premium is then a subtract and multiply.
+        pct_scale = 100 / best if best > 0 else 0
         for p in providers:
-            premium = ((p["price_per_gpu_hr"] - best) / best * 100) if best > 0 else 0
+            premium = (p["price_per_gpu_hr"] - best) * pct_scale
             prem_style = "green" if premium == 0 else "yellow" if premium < 20 else "red"
             spot_str = f"${p['spot_price']:.2f}" if p["spot_price"] else "N/A"
 
@@ -200,13 +299,11 @@ def render_provider_comparison(gpu_id: str = "H100-SXM") -> Panel:
     return Panel(table, border_style="green", box=box.ROUNDED)
 
 
+@cached_panel
 def render_historical_trends() -> Panel:
     table = Table(
         title="HISTORICAL PRICE TRENDS — Quarterly Average $/hr",
-        box=box.SIMPLE_HEAVY,
-        title_style="bold cyan",
-        header_style="bold white on dark_blue",
-        padding=(0, 1),
+        **TABLE_DEFAULTS,
     )
 
     table.add_column("GPU", style="bold white", min_width=14)
@@ -224,14 +321,15 @@ def render_historical_trends() -> Panel:
     table.add_column("Avail", justify="center")
 
     for gpu_id in ["H100-SXM", "H200", "B200", "A100-80GB", "A100-40GB", "MI300X", "RTX-4090"]:
-        if gpu_id not in HISTORICAL_PRICING:
+        hist = HISTORICAL_PRICING.get(gpu_id)
+        if hist is None:
             continue
-        hist = HISTORICAL_PRICING[gpu_id]
         row_vals = []
         cells = []
         for p in periods:
-            if p in hist:
-                val = hist[p]["avg"]
+            entry = hist.get(p)
+            if entry is not None:
+                val = entry["avg"]
                 row_vals.append(val)
                 cells.append(f"${val:.2f}")
             else:
@@ -240,7 +338,7 @@ def render_historical_trends() -> Panel:
         spark = sparkline(row_vals) if row_vals else "—"
 
         # Get latest availability
-        latest_period = sorted(hist.keys())[-1]
+        latest_period = _sorted_periods(gpu_id)[-1]
         avail = hist[latest_period]["availability"]
         avail_str = f"[{avail_color(avail)}]{avail.upper()}[/]"
 
@@ -249,13 +347,11 @@ def render_historical_trends() -> Panel:
     return Panel(table, border_style="magenta", box=box.ROUNDED)
 
 
+@cached_panel
 def render_regional_dashboard() -> Panel:
     table = Table(
         title="GLOBAL GPU MARKET — Regional Analysis",
-        box=box.SIMPLE_HEAVY,
-        title_style="bold cyan",
-        header_style="bold white on dark_blue",
-        padding=(0, 1),
+        **TABLE_DEFAULTS,
     )
 
     table.add_column("Region", style="bold white", min_width=18)
@@ -273,10 +369,9 @@ def render_regional_dashboard() -> Panel:
 
         # Demand bar
         demand = data["gpu_demand_index"]
-        bar_filled = "█" * (demand // 10)
-        bar_empty = "░" * (10 - demand // 10)
-        demand_color = "green" if demand >= 80 else "yellow" if demand >= 50 else "red"
-        demand_str = f"[{demand_color}]{bar_filled}{bar_empty}[/] {demand}"
+        bar = DEMAND_BARS[max(0, min(demand // 10, 10))]
+        demand_color = tier_color(demand, DEMAND_TIERS)
+        demand_str = f"[{demand_color}]{bar}[/] {demand}"
 
         table.add_row(
             region,
@@ -293,6 +388,7 @@ def render_regional_dashboard() -> Panel:
     return Panel(table, border_style="yellow", box=box.ROUNDED)
 
 
+@cached_panel
 def render_market_indicators() -> Panel:
     mi = MARKET_INDICATORS
 
@@ -343,15 +439,13 @@ def render_market_indicators() -> Panel:
     return Panel(text, title="[bold]MARKET INDICATORS[/]", border_style="cyan", box=box.ROUNDED)
 
 
+@cached_panel
 def render_workload_guide() -> Panel:
     recs = get_workload_recommendations()
 
     table = Table(
         title="WORKLOAD-BASED GPU GUIDE",
-        box=box.SIMPLE_HEAVY,
-        title_style="bold cyan",
-        header_style="bold white on dark_blue",
-        padding=(0, 1),
+        **TABLE_DEFAULTS,
     )
 
     table.add_column("Workload", style="bold white", min_width=22)
@@ -374,15 +468,48 @@ def render_workload_guide() -> Panel:
     return Panel(table, border_style="green", box=box.ROUNDED)
 
 
-def render_ai_analysis() -> Panel:
-    try:
-        from ai_analyzer import get_quick_summary
-        summary = get_quick_summary(use_cache=True)
-    except Exception as e:
-        summary = f"AI analysis unavailable: {e}"
+AI_REFRESH_SECONDS = 3600
+# How long the first dashboard frame waits for a summary before rendering without one.
+AI_FIRST_FRAME_TIMEOUT = 30
+
+_latest_summary = None
+_summary_ready = threading.Event()
+_summary_thread = None
+_first_frame_drawn = False
 
+
+def _refresh_ai_summary():
+    """Keep _latest_summary current so renders never wait on the LLM."""
+    global _latest_summary
+    # The first pass may reuse the on-disk cache so startup stays fast; later
+    # passes regenerate, since that cache shares AI_REFRESH_SECONDS as its TTL.
+    use_cache = True
+    while True:
+        try:
+            _latest_summary = _ai_analyzer().get_quick_summary(use_cache=use_cache)
+        except Exception as e:
+            _latest_summary = f"AI analysis unavailable: {e}"
+        _summary_ready.set()
+        use_cache = False
+        time.sleep(AI_REFRESH_SECONDS)
+
+
+def _start_ai_refresher():
+    global _summary_thread
+    if _summary_thread is not None:
+        return
+    _summary_thread = threading.Thread(target=_refresh_ai_summary, name="ai-summary", daemon=True)
+    _summary_thread.start()
+
+
+def render_ai_analysis(refreshes: bool = True) -> Panel:
+    _start_ai_refresher()
+    if refreshes:
+        placeholder = "*AI summary not ready yet — it will appear on a later refresh.*"
+    else:
+        placeholder = "*AI summary unavailable — the analyzer did not respond in time.*"
     return Panel(
-        Markdown(summary),
+        Markdown(_latest_summary or placeholder),
         title="[bold]AI MARKET ANALYSIS[/]",
         subtitle="[dim]Powered by LLM — Auto-refreshes hourly[/]",
         border_style="bright_magenta",
@@ -390,6 +517,7 @@ def render_ai_analysis() -> Panel:
     )
 
 
+@cached_panel
 def render_cost_calculator() -> Panel:
     text = Text()
     text.append("═══ QUICK COST ESTIMATES ═══\n\n", style="bold cyan")
@@ -411,27 +539,25 @@ def render_cost_calculator() -> Panel:
     return Panel(text, title="[bold]COST CALCULATOR[/]", border_style="green", box=box.ROUNDED)
 
 
+@cached_panel
 def render_news_feed() -> Panel:
     text = Text()
     for n in NEWS_FEED[:10]:
-        sent_style = "green" if n["sentiment"] == "positive" else "red" if n["sentiment"] == "negative" else "yellow"
-        impact_style = "bold red" if n["impact"] == "high" else "yellow" if n["impact"] == "medium" else "dim"
+        sent_style = SENTIMENT_COLORS.get(n["sentiment"], "yellow")
+        impact_style = IMPACT_COLORS.get(n["impact"], "dim")
         text.append(f"  [{n['date']}] ", style="dim")
         text.append(f"{n['source']}: ", style="bold cyan")
         text.append(f"{n['headline']}\n", style=sent_style)
-        text.append(f"    Category: {n['category']}  ", style="dim")
-        text.append(f"Impact: ", style="dim")
+        text.append(f"    Category: {n['category']}  Impact: ", style="dim")
         text.append(f"{n['impact'].upper()}\n", style=impact_style)
     return Panel(text, title="[bold]NEWS FEED[/]", border_style="red", box=box.ROUNDED)
 
 
+@cached_panel
 def render_spot_market() -> Panel:
     table = Table(
         title="SPOT MARKET — Live Bid/Ask ($/hr)",
-        box=box.SIMPLE_HEAVY,
-        title_style="bold cyan",
-        header_style="bold white on dark_blue",
-        padding=(0, 1),
+        **TABLE_DEFAULTS,
     )
 
     table.add_column("GPU", style="bold white", min_width=12)
@@ -462,22 +588,19 @@ def render_spot_market() -> Panel:
     return Panel(table, border_style="yellow", box=box.ROUNDED)
 
 
+@cached_panel
 def render_inference_economics() -> Panel:
     table = Table(
         title="INFERENCE ECONOMICS — $/Million Tokens (Self-Hosted)",
-        box=box.SIMPLE_HEAVY,
-        title_style="bold cyan",
-        header_style="bold white on dark_blue",
-        padding=(0, 1),
+        **TABLE_DEFAULTS,
     )
 
     # Collect top providers
-    models = sorted(INFERENCE_BENCHMARKS.keys(), key=lambda m: INFERENCE_BENCHMARKS[m].get("rank", 99))
+    models = _models_by_rank()
     prov_set = set()
     for m in models:
         prov_set.update(INFERENCE_BENCHMARKS[m].get("providers", {}).keys())
-    top_provs = ["OpenRouter", "OpenAI API", "Anthropic API", "Google Vertex", "DeepSeek API", "Together"]
-    provs = [p for p in top_provs if p in prov_set][:6]
+    provs = [p for p in INFERENCE_TOP_PROVIDERS if p in prov_set]
 
     table.add_column("#", style="dim", min_width=3)
     table.add_column("Model", style="bold white", min_width=18)
@@ -505,6 +628,7 @@ def render_inference_economics() -> Panel:
     return Panel(table, border_style="magenta", box=box.ROUNDED)
 
 
+@cached_panel
 def render_tco_breakdown() -> Panel:
     text = Text()
     text.append("═══ TOTAL COST OF OWNERSHIP — Hidden Costs per GPU-hour ═══\n\n", style="bold cyan")
@@ -521,10 +645,11 @@ def render_tco_breakdown() -> Panel:
         gpu_set.update(TCO_COMPONENTS[c].get("cost_per_gpu_hr", {}).keys())
     gpus = sorted(gpu_set)
 
+    # Base GPU cost per GPU, looked up from one matrix build
+    base_by_gpu = {r["gpu_id"]: r["cheapest_price"] for r in get_price_comparison_matrix()}
+
     for g in gpus[:6]:
-        # Get base GPU cost
-        matrix = get_price_comparison_matrix()
-        base = next((r["cheapest_price"] for r in matrix if r["gpu_id"] == g), 0)
+        base = base_by_gpu.get(g, 0)
 
         overhead = sum(TCO_COMPONENTS[c].get("cost_per_gpu_hr", {}).get(g, 0) for c in components)
         total = base + overhead
@@ -548,6 +673,7 @@ def render_tco_breakdown() -> Panel:
 # MAIN DASHBOARD
 # ============================================================================
 
+@cached_panel
 def render_utilization_metrics() -> Panel:
     """Render GPU utilization and efficiency metrics."""
     util = get_utilization_summary()
@@ -563,7 +689,7 @@ def render_utilization_metrics() -> Panel:
         best = max(data["providers"].items(), key=lambda x: x[1]["efficiency_score"])
         trend = best[1].get("utilization_trend", [])
         trend_str = sparkline(trend) if trend else ""
-        ut_color = "green" if data["avg_utilization"] >= 75 else "yellow" if data["avg_utilization"] >= 60 else "red"
+        ut_color = tier_color(data["avg_utilization"], UTILIZATION_TIERS)
         table.add_row(
             gpu_id, f"[{ut_color}]{data['avg_utilization']:.1f}%[/]",
             f"{data['avg_efficiency']:.1f}/100", best[0],
@@ -572,6 +698,7 @@ def render_utilization_metrics() -> Panel:
     return Panel(table, border_style="bright_cyan", box=box.DOUBLE)
 
 
+@cached_panel
 def render_reservation_analysis() -> Panel:
     """Render reservation and commitment analytics."""
     res = RESERVATION_ANALYTICS
@@ -596,6 +723,7 @@ def render_reservation_analysis() -> Panel:
     return Panel(table, border_style="bright_yellow", box=box.DOUBLE)
 
 
+@cached_panel
 def render_price_forecasts() -> Panel:
     """Render price elasticity and forecasting."""
     fc = PRICE_FORECASTS
@@ -609,10 +737,10 @@ def render_price_forecasts() -> Panel:
     table.add_column("Elasticity", justify="right", width=10)
     table.add_column("Supply", width=12)
 
-    for gpu_id in sorted(fc.keys(), key=lambda g: fc[g]["current_avg"], reverse=True):
+    for gpu_id in PRICE_FORECAST_ORDER:
         f = fc[gpu_id]
         chg = (f["forecast_12mo"]["mid"] - f["current_avg"]) / f["current_avg"] * 100
-        chg_color = "green" if chg < -10 else "yellow" if chg < 0 else "red"
+        chg_color = FORECAST_CHANGE_COLORS[bisect_right(FORECAST_CHANGE_THRESHOLDS, chg)]
         table.add_row(
             gpu_id, f"${f['current_avg']:.2f}",
             f"${f['forecast_3mo']['mid']:.2f}", f"${f['forecast_6mo']['mid']:.2f}",
@@ -623,6 +751,7 @@ def render_price_forecasts() -> Panel:
     return Panel(table, border_style="bright_blue", box=box.DOUBLE)
 
 
+@cached_panel
 def render_competitive_moat() -> Panel:
     """Render competitive landscape tracker."""
     comp = COMPETITIVE_MOAT
@@ -637,7 +766,7 @@ def render_competitive_moat() -> Panel:
     table.add_column("Products", width=20)
 
     for vendor, d in comp.items():
-        moat_color = "green" if d["moat_strength_score"] >= 70 else "yellow" if d["moat_strength_score"] >= 40 else "red"
+        moat_color = tier_color(d["moat_strength_score"], MOAT_TIERS)
         table.add_row(
             vendor.replace("_", " "), str(d["performance_score"]),
             str(d["ecosystem_maturity"]), str(d["software_compatibility"]),
@@ -649,6 +778,7 @@ def render_competitive_moat() -> Panel:
     return Panel(table, border_style="bright_magenta", box=box.DOUBLE)
 
 
+@cached_panel
 def render_sustainability_index() -> Panel:
     """Render energy and sustainability metrics."""
     sus = get_sustainability_summary()
@@ -661,7 +791,7 @@ def render_sustainability_index() -> Panel:
     table.add_column("Worst Region", width=14)
 
     for provider, data in sus["providers"].items():
-        sc_color = "green" if data["avg_sustainability_score"] >= 80 else "yellow" if data["avg_sustainability_score"] >= 60 else "red"
+        sc_color = tier_color(data["avg_sustainability_score"], SUSTAINABILITY_TIERS)
         table.add_row(
             provider, f"[{sc_color}]{data['avg_sustainability_score']}/100[/]",
             f"{data['avg_green_energy_pct']}%", f"{data['avg_pue']}",
@@ -670,6 +800,7 @@ def render_sustainability_index() -> Panel:
     return Panel(table, border_style="bright_green", box=box.DOUBLE)
 
 
+@cached_panel
 def render_supply_chain_risk() -> Panel:
     """Render supply chain risk dashboard."""
     sc = SUPPLY_CHAIN_RISK
@@ -682,7 +813,7 @@ def render_supply_chain_risk() -> Panel:
     table.add_column("Key Bottlenecks", width=30)
 
     for vendor, d in sc.items():
-        risk_color = "red" if d["supply_risk_score"] > 50 else "yellow" if d["supply_risk_score"] > 35 else "green"
+        risk_color = SUPPLY_RISK_COLORS[bisect_left(SUPPLY_RISK_TIERS, d["supply_risk_score"])]
         table.add_row(
             vendor, f"[{risk_color}]{d['supply_risk_score']}/100[/]",
             f"{d['tsmc_dependency_pct']}%", f"{d['lead_time_weeks']} wks",
@@ -691,6 +822,7 @@ def render_supply_chain_risk() -> Panel:
     return Panel(table, border_style="bright_red", box=box.DOUBLE)
 
 
+@cached_panel
 def render_model_fit_matrix() -> Panel:
     """Render model-to-hardware fit matrix."""
     mf = MODEL_HARDWARE_FIT
@@ -704,9 +836,10 @@ def render_model_fit_matrix() -> Panel:
     table.add_column("Fit Score", justify="right", width=10)
 
     for size, data in mf.items():
-        entries = sorted(data["gpus"].items(), key=lambda x: x[1]["fit_score"], reverse=True)
-        for i, (gpu, d) in enumerate(entries[:4]):
-            fit_color = "green" if d["fit_score"] >= 85 else "yellow" if d["fit_score"] >= 70 else "red"
+        # Only the top four are shown; nlargest keeps ties in dict order like sorted() did
+        entries = heapq.nlargest(4, data["gpus"].items(), key=lambda x: x[1]["fit_score"])
+        for i, (gpu, d) in enumerate(entries):
+            fit_color = tier_color(d["fit_score"], FIT_TIERS)
             table.add_row(
                 size if i == 0 else "", gpu, d["optimal_config"],
                 f"{d['throughput_tok_s']} tok/s", f"${d['cost_per_1m_tokens']}",
@@ -717,234 +850,269 @@ def render_model_fit_matrix() -> Panel:
     return Panel(table, border_style="bright_cyan", box=box.DOUBLE)
 
 
-def print_full_dashboard():
-    """Print the complete terminal dashboard."""
-    console.clear()
+# Static key hints at the start of the dashboard footer, as (text, style) pairs.
+FOOTER_KEYS = (
+    ("  [Q]uit  ", "bold white on dark_blue"),
+    ("  [R]efresh  ", "bold white on dark_green"),
+    ("  [A]I Deep Analysis  ", "bold white on dark_magenta"),
+    ("  [1-9] GPU Drill-down  ", "bold white on dark_red"),
+)
+
 
-    # Header
-    console.print(render_header())
-    console.print()
-
-    # Price Matrix
-    console.print(render_price_matrix())
-    console.print()
-
-    # Provider Comparison for top GPUs
-    console.print(render_provider_comparison("H100-SXM"))
-    console.print()
-
-    # Historical Trends
-    console.print(render_historical_trends())
-    console.print()
-
-    # Market Indicators + Regional side by side
-    console.print(render_market_indicators())
-    console.print()
-
-    console.print(render_regional_dashboard())
-    console.print()
-
-    # News Feed
-    console.print(render_news_feed())
-    console.print()
-
-    # Spot Market
-    console.print(render_spot_market())
-    console.print()
-
-    # Inference Economics
-    console.print(render_inference_economics())
-    console.print()
-
-    # TCO Breakdown
-    console.print(render_tco_breakdown())
-    console.print()
-
-    # Workload Guide + Cost Calculator
-    console.print(render_workload_guide())
-    console.print()
-    console.print(render_cost_calculator())
-    console.print()
-
-    # Utilization & Reservation
-    console.print(render_utilization_metrics())
-    console.print()
-    console.print(render_reservation_analysis())
-    console.print()
-
-    # Forecasting & Competitive
-    console.print(render_price_forecasts())
-    console.print()
-    console.print(render_competitive_moat())
-    console.print()
-
-    # Sustainability & Supply Chain
-    console.print(render_sustainability_index())
-    console.print()
-    console.print(render_supply_chain_risk())
-    console.print()
-
-    # Model Fit
-    console.print(render_model_fit_matrix())
-    console.print()
-
-    # AI Analysis
-    console.print(render_ai_analysis())
-    console.print()
+def print_full_dashboard(refreshes: bool = True):
+    """Print the complete terminal dashboard.
+
+    Pass refreshes=False for one-shot output (--static), where no later
+    frame will pick up a summary that arrives after this one.
+    """
+    global _first_frame_drawn
+    # Start fetching the AI summary now so it overlaps the data panels.
+    _start_ai_refresher()
+    # One clock reading for the whole frame, so header and footer agree.
+    now = time.time()
+
+    sections = [
+        # Header
+        render_header(now),
+        # Price Matrix
+        render_price_matrix(),
+        # Provider Comparison for top GPUs
+        render_provider_comparison("H100-SXM"),
+        # Historical Trends
+        render_historical_trends(),
+        # Market Indicators + Regional side by side
+        render_market_indicators(),
+        render_regional_dashboard(),
+        # News Feed
+        render_news_feed(),
+        # Spot Market
+        render_spot_market(),
+        # Inference Economics
+        render_inference_economics(),
+        # TCO Breakdown
+        render_tco_breakdown(),
+        # Workload Guide + Cost Calculator
+        render_workload_guide(),
+        render_cost_calculator(),
+        # Utilization & Reservation
+        render_utilization_metrics(),
+        render_reservation_analysis(),
+        # Forecasting & Competitive
+        render_price_forecasts(),
+        render_competitive_moat(),
+        # Sustainability & Supply Chain
+        render_sustainability_index(),
+        render_supply_chain_risk(),
+        # Model Fit
+        render_model_fit_matrix(),
+    ]
+
+    # AI Analysis: only the first frame waits; later ones show whatever the
+    # refresher has so far rather than stalling the REPL again.
+    if not _first_frame_drawn:
+        _first_frame_drawn = True
+        _summary_ready.wait(timeout=AI_FIRST_FRAME_TIMEOUT)
+    sections.append(render_ai_analysis(refreshes))
 
     # Footer
-    footer = Text()
-    footer.append("  [Q]uit  ", style="bold white on dark_blue")
-    footer.append("  [R]efresh  ", style="bold white on dark_green")
-    footer.append("  [A]I Deep Analysis  ", style="bold white on dark_magenta")
-    footer.append("  [1-9] GPU Drill-down  ", style="bold white on dark_red")
-    footer.append(f"  Last updated: {datetime.now().strftime('%H:%M:%S')}  ", style="dim")
-    console.print(Panel(footer, box=box.ROUNDED))
+    footer = Text.assemble(
+        *FOOTER_KEYS,
+        (f"  Last updated: {time.strftime('%H:%M:%S', time.localtime(now))}  ", "dim"),
+    )
+
+    # One print for the whole frame: a single layout pass and write, and the
+    # screen is only cleared once everything is ready to draw.
+    frame = []
+    for section in sections:
+        frame += (section, "")
+    frame.append(Panel(footer, box=box.ROUNDED))
+    console.clear()
+    console.print(Group(*frame))
+
+
+def _show_ai_analyses():
+    console.print("\n[bold magenta]Generating AI Analysis...[/]\n")
+    try:
+        analyses = _ai_analyzer().get_all_analyses(use_cache=False)
+        for key, text in analyses.items():
+            if key == "generated_at":
+                continue
+            console.print(Panel(
+                Markdown(str(text)),
+                title=f"[bold]{key.upper().replace('_', ' ')}[/]",
+                border_style="magenta",
+                box=box.DOUBLE,
+            ))
+            console.print()
+    except Exception as e:
+        console.print(f"[red]Error: {e}[/]")
+
+
+def _show_market_notes():
+    console.print("\n[bold orange1]Generating AI Market Notes...[/]\n")
+    try:
+        result = _ai_analyzer().generate_market_notes(use_cache=True)
+        console.print(Panel(Markdown(result), title="[bold]AI ANALYST MARKET NOTES[/]", border_style="bright_red", box=box.DOUBLE))
+    except Exception as e:
+        console.print(f"[red]Error: {e}[/]")
+
+
+@functools.lru_cache(maxsize=None)
+def _gpu_ids_by_upper() -> dict:
+    """Uppercased GPU id -> GPU_SPECS id, in GPU_SPECS order, built once."""
+    return {gid.upper(): gid for gid in GPU_SPECS}
+
+
+def _show_gpu_deep_dive(query: str):
+    gpu_name = query.upper().replace(" ", "-")
+    # Exact id first, then the first id (in GPU_SPECS order) containing the query
+    gpu_ids = _gpu_ids_by_upper()
+    matched = gpu_ids.get(gpu_name)
+    if matched is None:
+        matched = next((gid for key, gid in gpu_ids.items() if gpu_name in key), None)
+    if matched:
+        console.print(render_provider_comparison(matched))
+        console.print("\n[bold magenta]Generating AI deep-dive...[/]\n")
+        try:
+            result = _ai_analyzer().analyze_specific_gpu(matched)
+            console.print(Panel(Markdown(result), title=f"[bold]AI Analysis: {matched}[/]", border_style="magenta"))
+        except Exception as e:
+            console.print(f"[red]Error: {e}[/]")
+    else:
+        console.print(f"[red]GPU not found: {gpu_name}[/]")
+
+
+# How long to watch a freshly started web server for an early exit.
+WEB_SERVER_START_GRACE = 1.0
+
+
+def _start_web_server():
+    console.print("[bold cyan]Starting web server...[/]")
+    # No shell; a new session keeps the server out of this TTY's job control.
+    # stderr goes to an anonymous temp file so a failed start can be reported.
+    with tempfile.TemporaryFile() as err:
+        proc = subprocess.Popen(
+            [sys.executable, os.path.join(os.path.dirname(__file__), "server.py")],
+            stdout=subprocess.DEVNULL,
+            stderr=err,
+            start_new_session=True,
+        )
+        try:
+            code = proc.wait(timeout=WEB_SERVER_START_GRACE)
+        except subprocess.TimeoutExpired:
+            console.print("[green]Web dashboard available at http://localhost:8050[/]")
+            return
+        err.seek(0)
+        lines = err.read().decode(errors="replace").strip().splitlines()
+    reason = lines[-1] if lines else f"exit code {code}"
+    console.print(f"[red]Web server failed to start:[/] {escape(reason)}")
+
+
+def _show_help():
+    console.print(Panel(
+        "[bold]Available Commands:[/]\n\n"
+        "  [cyan]r, refresh[/]      — Refresh dashboard\n"
+        "  [cyan]a, ai[/]           — Full AI analysis\n"
+        "  [cyan]t, trends[/]       — Historical price trends\n"
+        "  [cyan]g, regional[/]     — Regional market data\n"
+        "  [cyan]m, market[/]       — Market indicators\n"
+        "  [cyan]w, workload[/]     — Workload recommendations\n"
+        "  [cyan]c, cost[/]         — Cost calculator\n"
+        "  [cyan]s, spot[/]         — Spot market live data\n"
+        "  [cyan]i, inference[/]    — Inference economics\n"
+        "  [cyan]tco[/]             — TCO breakdown analysis\n"
+        "  [cyan]n, news[/]         — Latest news feed\n"
+        "  [cyan]notes[/]           — AI analyst market notes\n"
+        "  [cyan]util[/]            — GPU utilization metrics\n"
+        "  [cyan]res[/]             — Reservation analytics\n"
+        "  [cyan]fc, forecast[/]    — Price forecasts\n"
+        "  [cyan]comp[/]            — Competitive moat tracker\n"
+        "  [cyan]sus, green[/]      — Sustainability index\n"
+        "  [cyan]supply, risk[/]    — Supply chain risk\n"
+        "  [cyan]fit, model[/]      — Model-to-hardware fit\n"
+        "  [cyan]gpu <name>[/]      — GPU deep-dive (e.g. gpu h100)\n"
+        "  [cyan]1-8[/]             — Quick GPU comparison\n"
+        "  [cyan]web[/]             — Start web dashboard\n"
+        "  [cyan]q, quit[/]         — Exit\n",
+        title="[bold]HELP[/]",
+        border_style="cyan",
+    ))
+
+
+QUIT_COMMANDS = ("q", "quit", "exit")
+
+# Pre-styled so the prompt's markup is not re-parsed on every command.
+PROMPT = Text.assemble(("GPU>", "bold blue"), " ")
+
+# Commands that print a single panel, by alias.
+PANEL_COMMANDS = {
+    **dict.fromkeys(("h100", "h", "1"), functools.partial(render_provider_comparison, "H100-SXM")),
+    **dict.fromkeys(("a100", "2"), functools.partial(render_provider_comparison, "A100-80GB")),
+    **dict.fromkeys(("h200", "3"), functools.partial(render_provider_comparison, "H200")),
+    **dict.fromkeys(("mi300x", "mi300", "4"), functools.partial(render_provider_comparison, "MI300X")),
+    **dict.fromkeys(("b200", "5"), functools.partial(render_provider_comparison, "B200")),
+    **dict.fromkeys(("4090", "rtx4090", "6"), functools.partial(render_provider_comparison, "RTX-4090")),
+    **dict.fromkeys(("trends", "t"), render_historical_trends),
+    **dict.fromkeys(("regional", "reg", "g"), render_regional_dashboard),
+    **dict.fromkeys(("market", "m"), render_market_indicators),
+    **dict.fromkeys(("workload", "w"), render_workload_guide),
+    **dict.fromkeys(("cost", "c"), render_cost_calculator),
+    **dict.fromkeys(("spot", "s"), render_spot_market),
+    **dict.fromkeys(("inference", "inf", "i"), render_inference_economics),
+    "tco": render_tco_breakdown,
+    **dict.fromkeys(("news", "n"), render_news_feed),
+    **dict.fromkeys(("util", "utilization"), render_utilization_metrics),
+    **dict.fromkeys(("res", "reservations"), render_reservation_analysis),
+    **dict.fromkeys(("forecast", "fc"), render_price_forecasts),
+    **dict.fromkeys(("competitive", "comp"), render_competitive_moat),
+    **dict.fromkeys(("sus", "sustainability", "green"), render_sustainability_index),
+    **dict.fromkeys(("supply", "risk"), render_supply_chain_risk),
+    **dict.fromkeys(("fit", "model", "modelfit"), render_model_fit_matrix),
+}
+
+# Every other exact-match command, by alias.
+COMMANDS = {
+    **dict.fromkeys(("r", "refresh"), print_full_dashboard),
+    **dict.fromkeys(("a", "ai", "analysis"), _show_ai_analyses),
+    "notes": _show_market_notes,
+    **dict.fromkeys(("web", "server"), _start_web_server),
+    **dict.fromkeys(("help", "?"), _show_help),
+}
 
 
 def run_interactive():
     """Run the interactive terminal dashboard."""
+    try:
+        import readline  # noqa: F401 -- line editing and history for console.input
+    except ImportError:
+        pass
     print_full_dashboard()
 
     console.print("\n[bold cyan]Commands:[/] [R]efresh | [A]I Analysis | [S]pot | [I]nference | [N]ews | [H]elp | [Q]uit\n")
 
     while True:
         try:
-            cmd = console.input("[bold blue]GPU>[/] ").strip().lower()
+            cmd = console.input(PROMPT).strip().lower()
         except (EOFError, KeyboardInterrupt):
             break
 
-        if cmd in ("q", "quit", "exit"):
+        if cmd in QUIT_COMMANDS:
             break
-        elif cmd in ("r", "refresh"):
-            print_full_dashboard()
-        elif cmd in ("a", "ai", "analysis"):
-            console.print("\n[bold magenta]Generating AI Analysis...[/]\n")
-            try:
-                from ai_analyzer import get_all_analyses
-                analyses = get_all_analyses(use_cache=False)
-                for key, text in analyses.items():
-                    if key == "generated_at":
-                        continue
-                    console.print(Panel(
-                        Markdown(str(text)),
-                        title=f"[bold]{key.upper().replace('_', ' ')}[/]",
-                        border_style="magenta",
-                        box=box.DOUBLE,
-                    ))
-                    console.print()
-            except Exception as e:
-                console.print(f"[red]Error: {e}[/]")
-        elif cmd in ("h100", "h", "1"):
-            console.print(render_provider_comparison("H100-SXM"))
-        elif cmd in ("a100", "2"):
-            console.print(render_provider_comparison("A100-80GB"))
-        elif cmd in ("h200", "3"):
-            console.print(render_provider_comparison("H200"))
-        elif cmd in ("mi300x", "mi300", "4"):
-            console.print(render_provider_comparison("MI300X"))
-        elif cmd in ("b200", "5"):
-            console.print(render_provider_comparison("B200"))
-        elif cmd in ("4090", "rtx4090", "6"):
-            console.print(render_provider_comparison("RTX-4090"))
-        elif cmd in ("trends", "t"):
-            console.print(render_historical_trends())
-        elif cmd in ("regional", "reg", "g"):
-            console.print(render_regional_dashboard())
-        elif cmd in ("market", "m"):
-            console.print(render_market_indicators())
-        elif cmd in ("workload", "w"):
-            console.print(render_workload_guide())
-        elif cmd in ("cost", "c"):
-            console.print(render_cost_calculator())
-        elif cmd in ("spot", "s"):
-            console.print(render_spot_market())
-        elif cmd in ("inference", "inf", "i"):
-            console.print(render_inference_economics())
-        elif cmd in ("tco",):
-            console.print(render_tco_breakdown())
-        elif cmd in ("news", "n"):
-            console.print(render_news_feed())
-        elif cmd in ("util", "utilization"):
-            console.print(render_utilization_metrics())
-        elif cmd in ("res", "reservations"):
-            console.print(render_reservation_analysis())
-        elif cmd in ("forecast", "fc"):
-            console.print(render_price_forecasts())
-        elif cmd in ("competitive", "comp"):
-            console.print(render_competitive_moat())
-        elif cmd in ("sus", "sustainability", "green"):
-            console.print(render_sustainability_index())
-        elif cmd in ("supply", "risk"):
-            console.print(render_supply_chain_risk())
-        elif cmd in ("fit", "model", "modelfit"):
-            console.print(render_model_fit_matrix())
-        elif cmd in ("notes",):
-            console.print("\n[bold orange1]Generating AI Market Notes...[/]\n")
-            try:
-                from ai_analyzer import generate_market_notes
-                result = generate_market_notes(use_cache=True)
-                console.print(Panel(Markdown(result), title="[bold]AI ANALYST MARKET NOTES[/]", border_style="bright_red", box=box.DOUBLE))
-            except Exception as e:
-                console.print(f"[red]Error: {e}[/]")
+        render = PANEL_COMMANDS.get(cmd)
+        if render is not None:
+            console.print(render())
+            continue
+        action = COMMANDS.get(cmd)
+        if action is not None:
+            action()
         elif cmd.startswith("gpu "):
-            gpu_name = cmd[4:].upper().replace(" ", "-")
-            # Try to match
-            matched = None
-            for gid in GPU_SPECS:
-                if gpu_name in gid.upper():
-                    matched = gid
-                    break
-            if matched:
-                console.print(render_provider_comparison(matched))
-                console.print("\n[bold magenta]Generating AI deep-dive...[/]\n")
-                try:
-                    from ai_analyzer import analyze_specific_gpu
-                    result = analyze_specific_gpu(matched)
-                    console.print(Panel(Markdown(result), title=f"[bold]AI Analysis: {matched}[/]", border_style="magenta"))
-                except Exception as e:
-                    console.print(f"[red]Error: {e}[/]")
-            else:
-                console.print(f"[red]GPU not found: {gpu_name}[/]")
-        elif cmd in ("web", "server"):
-            console.print("[bold cyan]Starting web server...[/]")
-            os.system(f"python3 {os.path.join(os.path.dirname(__file__), 'server.py')} &")
-            console.print("[green]Web dashboard available at http://localhost:8050[/]")
-        elif cmd in ("help", "?"):
-            console.print(Panel(
-                "[bold]Available Commands:[/]\n\n"
-                "  [cyan]r, refresh[/]      — Refresh dashboard\n"
-                "  [cyan]a, ai[/]           — Full AI analysis\n"
-                "  [cyan]t, trends[/]       — Historical price trends\n"
-                "  [cyan]g, regional[/]     — Regional market data\n"
-                "  [cyan]m, market[/]       — Market indicators\n"
-                "  [cyan]w, workload[/]     — Workload recommendations\n"
-                "  [cyan]c, cost[/]         — Cost calculator\n"
-                "  [cyan]s, spot[/]         — Spot market live data\n"
-                "  [cyan]i, inference[/]    — Inference economics\n"
-                "  [cyan]tco[/]             — TCO breakdown analysis\n"
-                "  [cyan]n, news[/]         — Latest news feed\n"
-                "  [cyan]notes[/]           — AI analyst market notes\n"
-                "  [cyan]util[/]            — GPU utilization metrics\n"
-                "  [cyan]res[/]             — Reservation analytics\n"
-                "  [cyan]fc, forecast[/]    — Price forecasts\n"
-                "  [cyan]comp[/]            — Competitive moat tracker\n"
-                "  [cyan]sus, green[/]      — Sustainability index\n"
-                "  [cyan]supply, risk[/]    — Supply chain risk\n"
-                "  [cyan]fit, model[/]      — Model-to-hardware fit\n"
-                "  [cyan]gpu <name>[/]      — GPU deep-dive (e.g. gpu h100)\n"
-                "  [cyan]1-8[/]             — Quick GPU comparison\n"
-                "  [cyan]web[/]             — Start web dashboard\n"
-                "  [cyan]q, quit[/]         — Exit\n",
-                title="[bold]HELP[/]",
-                border_style="cyan",
-            ))
+            _show_gpu_deep_dive(cmd[4:])
         else:
             console.print("[dim]Unknown command. Type 'help' for options.[/]")
 
 
 if __name__ == "__main__":
     if "--static" in sys.argv:
-        print_full_dashboard()
+        print_full_dashboard(refreshes=False)
     else:
         run_interactive()